@@ -1,6 +1,8 @@
 import sys
 from pathlib import Path
 
+from cass_tui.app import CassTuiApp
+
 
 def main() -> int:
     workspace = Path(sys.argv[1]) if len(sys.argv) > 1 else Path.cwd()
@@ -9,8 +11,6 @@ def main() -> int:
         print(f"Workspace not found: {workspace}")
         return 1
     
-    from cass_tui.app import CassTuiApp
-    
     app = CassTuiApp(workspace=workspace)
     app.run()
     return 0
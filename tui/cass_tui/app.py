@@ -1,11 +1,13 @@
 from pathlib import Path
+import time
+
 from textual import work
 from textual.app import App, ComposeResult
 from textual.binding import Binding
-from textual.containers import Horizontal, Vertical, VerticalScroll
+from textual.containers import Horizontal, Vertical
 from textual.reactive import reactive
-from textual.widgets import Footer, Header, RichLog, Static, ListView, ListItem, Label, Rule
-from textual.worker import get_current_worker
+from textual.widgets import Footer, Header, Static, ListView, ListItem, Label, OptionList
+from textual.widgets.option_list import Option
 
 from cass_tui.services import SessionIndex, Session, AgentSessions
 
@@ -24,8 +26,16 @@ AGENT_COLORS = {
 }
 
 
-def agent_color(agent: str) -> str:
-    return AGENT_COLORS.get(agent, "white")
+def _agent_render(color: str) -> tuple[str, str, str]:
+    # (list bullet, header open tag, header close tag)
+    return (f"[{color}]●[/{color}] ", f"[bold {color}]", f"[/bold {color}]")
+
+
+# Markup fragments per agent, built once so row rendering is concatenation only
+_AGENT_RENDER: dict[str, tuple[str, str, str]] = {
+    agent: _agent_render(color) for agent, color in AGENT_COLORS.items()
+}
+_DEFAULT_RENDER = _agent_render("white")
 
 
 class AgentListItem(ListItem):
@@ -35,46 +45,37 @@ class AgentListItem(ListItem):
     
     def compose(self) -> ComposeResult:
         agent = self.agent_sessions.agent
-        count = self.agent_sessions.count
-        color = agent_color(agent)
-        yield Label(f"[{color}]●[/{color}] {agent} [dim]({count})[/dim]")
+        bullet = _AGENT_RENDER.get(agent, _DEFAULT_RENDER)[0]
+        yield Label(f"{bullet}{agent} [dim]({self.agent_sessions.count})[/dim]")
 
 
-class SessionListItem(ListItem):
-    def __init__(self, session: Session) -> None:
-        super().__init__()
-        self.session = session
-    
-    def compose(self) -> ComposeResult:
-        age_seconds = self.session.age_seconds
-        # Handle infinity or very large values
-        if age_seconds == float('inf') or age_seconds > 365 * 86400 * 100:  # > 100 years
-            age_str = "?"
-            date_str = ""
-        else:
-            age = int(age_seconds)
-            if age < 60:
-                age_str = f"{age}s"
-            elif age < 3600:
-                age_str = f"{age // 60}m"
-            elif age < 86400:
-                age_str = f"{age // 3600}h"
-            else:
-                age_str = f"{age // 86400}d"
-            
-            # Format date/time
-            if self.session.started_at:
-                date_str = self.session.started_at.strftime("%m/%d %H:%M")
-            else:
-                date_str = ""
-        
-        color = agent_color(self.session.agent)
-        name = self.session.display_name
-        # Show: name (date time) age
-        if date_str:
-            yield Label(f"[{color}]●[/{color}] {name}\n  [dim]{date_str} ({age_str} ago)[/dim]")
-        else:
-            yield Label(f"[{color}]●[/{color}] {name} [dim]({age_str})[/dim]")
+def render_session_label(agent_sessions: AgentSessions, index: int) -> str:
+    age_str = agent_sessions.age_strs[index]
+    started_at = agent_sessions.started_ats[index]
+    bullet = _AGENT_RENDER.get(agent_sessions.agent, _DEFAULT_RENDER)[0]
+    name = agent_sessions.display_name(index)
+    # Show: name (date time) age
+    if age_str != "?" and started_at is not None:
+        date_str = time.strftime("%m/%d %H:%M", time.localtime(started_at))
+        return f"{bullet}{name}\n  [dim]{date_str} ({age_str} ago)[/dim]"
+    return f"{bullet}{name} [dim]({age_str})[/dim]"
+
+
+def render_session_detail(session: Session) -> str:
+    _, header_open, header_close = _AGENT_RENDER.get(session.agent, _DEFAULT_RENDER)
+    workspace = f"[bold]Workspace:[/bold] {session.workspace}\n" if session.workspace else ""
+    started = (
+        f"[bold]Started:[/bold] {session.started_at.strftime('%Y-%m-%d %H:%M:%S')}\n"
+        if session.started_at
+        else ""
+    )
+    return (
+        f"{header_open}{session.agent.upper()}{header_close}\n\n"
+        f"[bold]Title:[/bold] {session.title or 'Untitled'}\n"
+        f"[bold]Path:[/bold] {session.source_path}\n"
+        f"{workspace}{started}\n"
+        "[dim]Press Enter to open in editor[/dim]"
+    )
 
 
 class SessionDetailPanel(Static):
@@ -89,24 +90,9 @@ class SessionDetailPanel(Static):
         self._session = session
         content = self.query_one("#detail-content", Static)
         
-        color = agent_color(session.agent)
-        lines = [
-            f"[bold {color}]{session.agent.upper()}[/bold {color}]",
-            "",
-            f"[bold]Title:[/bold] {session.title or 'Untitled'}",
-            f"[bold]Path:[/bold] {session.source_path}",
-        ]
-        
-        if session.workspace:
-            lines.append(f"[bold]Workspace:[/bold] {session.workspace}")
-        
-        if session.started_at:
-            lines.append(f"[bold]Started:[/bold] {session.started_at.strftime('%Y-%m-%d %H:%M:%S')}")
-        
-        lines.append("")
-        lines.append("[dim]Press Enter to open in editor[/dim]")
-        
-        content.update("\n".join(lines))
+        if session.rendered_detail is None:
+            session.rendered_detail = render_session_detail(session)
+        content.update(session.rendered_detail)
 
 
 class AgentSessionsPanel(Static):
@@ -119,16 +105,16 @@ class AgentSessionsPanel(Static):
         yield Static("[bold cyan]Agents[/bold cyan]", id="agents-header")
         yield ListView(id="agent-list")
     
-    def refresh_agents(self) -> None:
-        self._agents = self.session_index.get_all_agents_with_sessions()
+    def refresh_agents(self, agents: list[AgentSessions]) -> None:
+        self._agents = agents
         agent_list = self.query_one("#agent-list", ListView)
-        agent_list.clear()
         
-        if not self._agents:
-            agent_list.append(ListItem(Label("[dim]No sessions found[/dim]")))
-        else:
-            for agent_sessions in self._agents:
-                agent_list.append(AgentListItem(agent_sessions))
+        with self.app.batch_update():
+            agent_list.clear()
+            if not self._agents:
+                agent_list.append(ListItem(Label("[dim]No sessions found[/dim]")))
+            else:
+                agent_list.extend(AgentListItem(agent_sessions) for agent_sessions in self._agents)
     
     @property
     def agents(self) -> list[AgentSessions]:
@@ -172,6 +158,8 @@ class CassTuiApp(App):
     
     #session-list {
         height: 1fr;
+        border: none;
+        background: $surface;
     }
     
     #detail-container {
@@ -206,11 +194,6 @@ class CassTuiApp(App):
     ListItem:hover {
         background: $primary-darken-2;
     }
-    
-    #session-list ListItem {
-        height: auto;
-        min-height: 2;
-    }
     """
     
     BINDINGS = [
@@ -236,7 +219,7 @@ class CassTuiApp(App):
             with Vertical(id="sidebar"):
                 yield AgentSessionsPanel(self.session_index, id="agents-panel")
                 yield Static("[bold]Sessions[/bold]", id="sessions-header")
-                yield ListView(id="session-list")
+                yield OptionList(id="session-list")
             
             with Vertical(id="detail-container"):
                 yield Static("Loading...", id="status-bar")
@@ -251,8 +234,19 @@ class CassTuiApp(App):
     
     @work(exclusive=True, thread=True)
     def refresh_data(self) -> None:
+        self.session_index.refresh()
+        agents = self.session_index.get_all_agents_with_sessions()
+        # Format rows here, off the UI thread, against one clock reading
+        now = time.time()
+        for agent_sessions in agents:
+            agent_sessions.stamp_ages(now)
+            agent_sessions.labels = [
+                render_session_label(agent_sessions, index)
+                for index in range(agent_sessions.count)
+            ]
+        
         agents_panel = self.query_one("#agents-panel", AgentSessionsPanel)
-        self.call_from_thread(agents_panel.refresh_agents)
+        self.call_from_thread(agents_panel.refresh_agents, agents)
         self.call_from_thread(self._update_status)
         
         if agents_panel.agents:
@@ -287,14 +281,17 @@ class CassTuiApp(App):
         
         self._agent_sessions[agent] = agent_sessions
         
-        session_list = self.query_one("#session-list", ListView)
-        session_list.clear()
-        
-        for session in agent_sessions.sessions:
-            session_list.append(SessionListItem(session))
+        # OptionList renders rows as lines, so only visible rows are drawn
+        # and no widget is mounted per session
+        session_list = self.query_one("#session-list", OptionList)
+        session_list.clear_options()
+        session_list.add_options(
+            Option(label, id=str(index))
+            for index, label in enumerate(agent_sessions.labels)
+        )
         
-        if agent_sessions.sessions:
-            self.current_session = agent_sessions.sessions[0]
+        if agent_sessions.count:
+            self.current_session = agent_sessions.session(0)
     
     def watch_current_session(self, session: Session | None) -> None:
         if session is None:
@@ -306,8 +303,11 @@ class CassTuiApp(App):
     def on_list_view_selected(self, event: ListView.Selected) -> None:
         if isinstance(event.item, AgentListItem):
             self.current_agent = event.item.agent_sessions.agent
-        elif isinstance(event.item, SessionListItem):
-            self.current_session = event.item.session
+    
+    def on_option_list_option_selected(self, event: OptionList.OptionSelected) -> None:
+        agent_sessions = self._agent_sessions.get(self.current_agent)
+        if agent_sessions is not None and event.option_id is not None:
+            self.current_session = agent_sessions.session(int(event.option_id))
     
     def action_refresh(self) -> None:
         self.refresh_data()
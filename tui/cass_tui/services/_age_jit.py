@@ -0,0 +1,52 @@
+"""Numba-compiled age bucketing for ``AgentSessions.stamp_ages``.
+
+Imported lazily by session_index: numpy and numba together cost about as
+much import time as textual, and only large agents ever need them.
+"""
+import numpy as np
+from numba import njit
+
+UNIT_CHARS = ("s", "m", "h", "d")
+
+
+@njit(cache=True)
+def _age_buckets(epochs, now):
+    """Vectorized format_age: (unit code into UNIT_CHARS or -1 for "?", magnitude).
+    
+    Missing start times are passed as NaN.
+    """
+    n = epochs.shape[0]
+    codes = np.empty(n, np.int8)
+    values = np.empty(n, np.int64)
+    for i in range(n):
+        age_seconds = now - epochs[i]
+        if np.isnan(age_seconds) or age_seconds > 365 * 86400 * 100:
+            codes[i] = -1
+            values[i] = 0
+            continue
+        age = int(age_seconds)
+        if age >= 86400:
+            codes[i] = 3
+            values[i] = age // 86400
+        elif age >= 3600:
+            codes[i] = 2
+            values[i] = age // 3600
+        elif age >= 60:
+            codes[i] = 1
+            values[i] = age // 60
+        else:
+            codes[i] = 0
+            values[i] = age
+    return codes, values
+
+
+def age_strs(started_ats: list[float | None], now: float) -> list[str]:
+    epochs = np.array(
+        [np.nan if ts is None else ts for ts in started_ats],
+        dtype=np.float64,
+    )
+    codes, values = _age_buckets(epochs, now)
+    return [
+        f"{value}{UNIT_CHARS[code]}" if code >= 0 else "?"
+        for code, value in zip(codes.tolist(), values.tolist())
+    ]
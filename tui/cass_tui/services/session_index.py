@@ -1,12 +1,46 @@
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import cache
+from operator import attrgetter
 from pathlib import Path
+import hashlib
 import json
+import pickle
+import selectors
 import subprocess
 import os
+import sys
+import tempfile
+import threading
+import time
 
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
 
-@dataclass
+try:
+    from ciso8601 import parse_datetime
+except ImportError:
+    def parse_datetime(ts: str) -> datetime:
+        # fromisoformat only accepts a trailing "Z" from Python 3.11 on
+        if ts[-1:] == "Z":
+            ts = ts[:-1] + "+00:00"
+        return datetime.fromisoformat(ts)
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+CACHE_VERSION = 6
+CACHE_PATH = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "cass_tui" / "index.bin"
+
+
+@dataclass(slots=True)
 class Session:
     source_path: Path
     agent: str
@@ -14,12 +48,8 @@ class Session:
     title: str | None
     started_at: datetime | None
     message_count: int
-    
-    @property
-    def age_seconds(self) -> float:
-        if self.started_at is None:
-            return float("inf")
-        return (datetime.now() - self.started_at).total_seconds()
+    # Detail-panel markup, rendered by the UI on first display
+    rendered_detail: str | None = field(default=None, init=False, repr=False, compare=False)
     
     @property
     def display_name(self) -> str:
@@ -28,14 +58,165 @@ class Session:
         return self.source_path.name[:60]
 
 
-@dataclass
+AGE_UNITS = ((86400, "d"), (3600, "h"), (60, "m"), (1, "s"))
+
+
+def format_age(age_seconds: float) -> str:
+    # Unknown, or implausibly old (> 100 years)
+    if age_seconds > 365 * 86400 * 100:
+        return "?"
+    age = int(age_seconds)
+    for unit, suffix in AGE_UNITS:
+        if age >= unit:
+            return f"{age // unit}{suffix}"
+    return f"{age}s"
+
+
+# Below this many rows the JIT call overhead outweighs the Python loop
+_JIT_MIN_ROWS = 256
+_jit_age_strs: Callable[[list[float | None], float], list[str]] | None = None
+_jit_loaded = False
+
+
+def _load_jit_age_strs() -> Callable[[list[float | None], float], list[str]] | None:
+    """Import the numba kernel on first use; None if numba is not installed."""
+    global _jit_age_strs, _jit_loaded
+    if not _jit_loaded:
+        try:
+            from ._age_jit import age_strs
+        except ImportError:
+            age_strs = None
+        _jit_age_strs = age_strs
+        _jit_loaded = True
+    return _jit_age_strs
+
+
+@dataclass(slots=True)
 class AgentSessions:
+    """An agent's sessions, stored column-wise.
+    
+    Row i across the lists is one session; ``session(i)`` materializes it.
+    ``started_ats`` holds epoch seconds so ages need no datetime arithmetic.
+    ``age_strs`` and ``labels`` are filled in by the UI's refresh worker
+    from a single ``time.time()`` snapshot.
+    """
     agent: str
-    sessions: list[Session] = field(default_factory=list)
+    source_paths: list[str] = field(default_factory=list)
+    workspaces: list[str | None] = field(default_factory=list)
+    titles: list[str | None] = field(default_factory=list)
+    started_ats: list[float | None] = field(default_factory=list)
+    age_strs: list[str] = field(default_factory=list)
+    labels: list[str] = field(default_factory=list)
+    _views: dict[int, Session] = field(default_factory=dict, repr=False, compare=False)
     
     @property
     def count(self) -> int:
-        return len(self.sessions)
+        return len(self.source_paths)
+    
+    def append(
+        self,
+        source_path: str,
+        workspace: str | None,
+        title: str | None,
+        started_at: float | None,
+    ) -> None:
+        self.source_paths.append(source_path)
+        self.workspaces.append(workspace)
+        self.titles.append(title)
+        self.started_ats.append(started_at)
+    
+    def sort_by_started(self) -> None:
+        """Order rows newest first; sessions without a start time go last."""
+        started_ats = self.started_ats
+        # Resolve missing start times once, then let the C-level __getitem__
+        # supply keys instead of a Python lambda frame per element
+        sort_keys = [float("-inf") if ts is None else ts for ts in started_ats]
+        order = sorted(range(len(sort_keys)), key=sort_keys.__getitem__, reverse=True)
+        self.source_paths = [self.source_paths[i] for i in order]
+        self.workspaces = [self.workspaces[i] for i in order]
+        self.titles = [self.titles[i] for i in order]
+        self.started_ats = [started_ats[i] for i in order]
+        self._views.clear()
+    
+    def stamp_ages(self, now: float) -> None:
+        if len(self.started_ats) >= _JIT_MIN_ROWS and (jit_age_strs := _load_jit_age_strs()):
+            self.age_strs = jit_age_strs(self.started_ats, now)
+            return
+        self.age_strs = [
+            format_age(now - ts) if ts is not None else "?"
+            for ts in self.started_ats
+        ]
+    
+    def display_name(self, i: int) -> str:
+        if title := self.titles[i]:
+            return title[:60]
+        return os.path.basename(self.source_paths[i])[:60]
+    
+    def session(self, i: int) -> Session:
+        """Row i as a Session; the same object is returned on later calls."""
+        if (view := self._views.get(i)) is not None:
+            return view
+        started_at = self.started_ats[i]
+        view = self._views[i] = Session(
+            source_path=Path(self.source_paths[i]),
+            agent=self.agent,
+            workspace=self.workspaces[i],
+            title=self.titles[i],
+            started_at=datetime.fromtimestamp(started_at) if started_at is not None else None,
+            message_count=1,
+        )
+        return view
+
+
+@dataclass(slots=True)
+class _CacheEntry:
+    mtime: int
+    size: int
+    xxh3: int
+    payload: bytes
+    query: tuple[str, ...] = ()
+    # (mtime_ns, size) of the SQLite -wal sidecar, which holds committed
+    # writes the main file's stat does not reflect until a checkpoint
+    wal: tuple[int, int] | None = None
+    version: int = CACHE_VERSION
+
+
+def _wal_stat(db_path: Path) -> tuple[int, int] | None:
+    try:
+        st = os.stat(f"{db_path}-wal")
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _hash_file(path: Path) -> int:
+    hasher = xxhash.xxh3_64() if xxhash else hashlib.blake2b(digest_size=8)
+    with open(path, "rb") as f:
+        while chunk := f.read(1 << 20):
+            hasher.update(chunk)
+    return int.from_bytes(hasher.digest(), "big")
+
+
+# The only hit fields the TUI reads; without --fields every hit also carries
+# the full message content and snippet
+HIT_FIELDS = "source_path,agent,title,workspace,created_at"
+
+
+def _jsonl_argv(args: list[str] | tuple[str, ...]) -> list[str]:
+    return ["cass", *args, "--fields", HIT_FIELDS, "--robot-format", "jsonl"]
+
+
+def _parse_hit_line(line: bytes) -> dict | None:
+    """Decode one line of ``--robot-format jsonl`` output; None for non-hits."""
+    if not line.strip():
+        return None
+    try:
+        hit = _loads(line)
+    except ValueError:
+        return None
+    if isinstance(hit, dict) and "_meta" not in hit:
+        return hit
+    return None
 
 
 class SessionIndex:
@@ -52,77 +233,418 @@ class SessionIndex:
         "pi_agent",
     )
     
-    def __init__(self, workspace: Path | None = None, filter_by_workspace: bool = False):
+    # Seconds any single cass invocation may run before it is killed
+    CASS_TIMEOUT = 30
+    
+    def __init__(
+        self,
+        workspace: Path | None = None,
+        filter_by_workspace: bool = False,
+        cache_path: Path | None = CACHE_PATH,
+    ):
         self.workspace = workspace or Path.cwd()
         self.filter_by_workspace = filter_by_workspace
-        self._cache: dict[str, AgentSessions] = {}
+        self.cache_path = cache_path
+        # Memoized `cass --json` output for the current refresh cycle, keyed
+        # on argv. Only `cass stats` goes through it: searches are streamed
+        # and each runs once per refresh
+        self._cache: dict[tuple[str, ...], dict | None] = {}
+        self._cache_lock = threading.Lock()
+        # The database location is fixed for the life of the TUI, so it is
+        # looked up once rather than spawning `cass stats` every refresh
+        self._db_path: Path | None = None
     
     def _run_cass_search(self, *args: str) -> dict | None:
+        with self._cache_lock:
+            if args in self._cache:
+                return self._cache[args]
+        parsed = self._invoke_cass(*args)
+        with self._cache_lock:
+            self._cache[args] = parsed
+        return parsed
+    
+    def _invoke_cass(self, *args: str) -> dict | None:
         try:
+            # Keep stdout as bytes: orjson decodes UTF-8 itself
             result = subprocess.run(
                 ["cass", *args, "--json"],
                 capture_output=True,
-                text=True,
-                timeout=30,
+                timeout=self.CASS_TIMEOUT,
             )
             if result.returncode != 0:
                 return None
-            parsed = json.loads(result.stdout)
+            parsed = _loads(result.stdout)
             if isinstance(parsed, dict):
                 return parsed
             return None
-        except (subprocess.TimeoutExpired, json.JSONDecodeError, FileNotFoundError):
+        except (subprocess.TimeoutExpired, ValueError, FileNotFoundError):
             return None
     
-    def get_sessions_for_agent(self, agent: str) -> list[Session]:
-        args = ["search", "", "--agent", agent, "--limit", "100"]
+    def _run_cass_search_stream(self, *args: str) -> Iterator[dict]:
+        """Yield hits from ``cass <args> --robot-format jsonl`` line by line.
+        
+        Only HIT_FIELDS are requested, keeping each line small.
+        
+        Raises CalledProcessError if cass exits non-zero or is killed after
+        CASS_TIMEOUT seconds.
+        """
+        proc = subprocess.Popen(
+            _jsonl_argv(args),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+        deadline = time.monotonic() + self.CASS_TIMEOUT
+        timer = threading.Timer(self.CASS_TIMEOUT, proc.kill)
+        timer.start()
+        finished = False
+        try:
+            for line in proc.stdout:
+                if (hit := _parse_hit_line(line)) is not None:
+                    yield hit
+            finished = True
+        finally:
+            timer.cancel()
+            proc.stdout.close()
+            if not finished:
+                proc.kill()
+                proc.wait()
+        # cass can close stdout and keep running; the deadline still applies
+        try:
+            proc.wait(timeout=max(deadline - time.monotonic(), 0))
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+            raise subprocess.CalledProcessError(proc.returncode, proc.args) from None
+        if proc.returncode != 0:
+            raise subprocess.CalledProcessError(proc.returncode, proc.args)
+    
+    AGGREGATE_LIMIT = 1000
+    PER_AGENT_LIMIT = 100
+    
+    def _run_cass_search_all(self, limit: int = AGGREGATE_LIMIT) -> Iterator[dict]:
+        args = ["search", "", "--limit", str(limit)]
         if self.filter_by_workspace:
             args.extend(["--workspace", str(self.workspace)])
-        data = self._run_cass_search(*args)
-        
-        if not data or "hits" not in data:
-            return []
+        return self._run_cass_search_stream(*args)
+    
+    @staticmethod
+    def _append_hit(sessions: AgentSessions, hit: dict) -> None:
+        get = hit.get
+        started_at = None
+        if ts := get("created_at"):
+            try:
+                if isinstance(ts, int):
+                    started_at = ts / 1000
+                else:
+                    started_at = parse_datetime(ts).timestamp()
+            except (ValueError, OSError, OverflowError):
+                pass
         
-        sessions: list[Session] = []
+        sessions.append(
+            get("source_path", ""),
+            get("workspace"),
+            get("title"),
+            started_at,
+        )
+    
+    def _agent_search_args(self, agent: str) -> list[str]:
+        args = ["search", "", "--agent", agent, "--limit", str(self.PER_AGENT_LIMIT)]
+        if self.filter_by_workspace:
+            args.extend(["--workspace", str(self.workspace)])
+        return args
+    
+    def get_sessions_for_agent(self, agent: str) -> AgentSessions:
+        args = self._agent_search_args(agent)
+        sessions = AgentSessions(agent=agent)
         seen_paths: set[str] = set()
+        # Bound once: these run for every hit cass returns
+        seen_contains = seen_paths.__contains__
+        seen_add = seen_paths.add
+        append_hit = self._append_hit
+        try:
+            for hit in self._run_cass_search_stream(*args):
+                source_path = hit.get("source_path", "")
+                if seen_contains(source_path):
+                    continue
+                seen_add(source_path)
+                append_hit(sessions, hit)
+        except (subprocess.CalledProcessError, FileNotFoundError):
+            return AgentSessions(agent=agent)
         
-        for hit in data.get("hits", []):
-            source_path = hit.get("source_path", "")
-            if source_path in seen_paths:
-                continue
-            seen_paths.add(source_path)
-            
-            started_at = None
-            if ts := hit.get("created_at"):
-                try:
-                    if isinstance(ts, int):
-                        started_at = datetime.fromtimestamp(ts / 1000)
-                    else:
-                        started_at = datetime.fromisoformat(ts.replace("Z", "+00:00"))
-                except (ValueError, OSError):
-                    pass
-            
-            sessions.append(Session(
-                source_path=Path(source_path),
-                agent=agent,
-                workspace=hit.get("workspace"),
-                title=hit.get("title"),
-                started_at=started_at,
-                message_count=1,
-            ))
-        
-        sessions.sort(key=lambda s: s.started_at or datetime.min, reverse=True)
+        sessions.sort_by_started()
         return sessions
     
+    def _get_all_sessions_aggregated(self) -> tuple[dict[str, AgentSessions], int] | None:
+        """One cass query for every agent, grouped here; None if the query fails.
+        
+        Also returns the raw hit count, so callers can tell when the limit
+        was reached and quieter agents may have been crowded out.
+        """
+        by_agent: dict[str, AgentSessions] = {}
+        hit_count = 0
+        seen: set[tuple[str, str]] = set()
+        # Bound once: these run for every hit cass returns
+        seen_contains = seen.__contains__
+        seen_add = seen.add
+        by_agent_get = by_agent.get
+        append_hit = self._append_hit
+        
+        try:
+            for hit in self._run_cass_search_all():
+                hit_count += 1
+                get = hit.get
+                agent = get("agent")
+                if not agent:
+                    continue
+                key = (agent, get("source_path", ""))
+                if seen_contains(key):
+                    continue
+                seen_add(key)
+                if (sessions := by_agent_get(agent)) is None:
+                    sessions = by_agent[agent] = AgentSessions(agent=agent)
+                append_hit(sessions, hit)
+        except (subprocess.CalledProcessError, FileNotFoundError):
+            return None
+        
+        for sessions in by_agent.values():
+            sessions.sort_by_started()
+        return by_agent, hit_count
+    
+    def _stats_agent_counts(self) -> dict[str, int] | None:
+        """Per-agent conversation counts from `cass stats`, or None if unavailable.
+        
+        The counts are global: they ignore --workspace.
+        """
+        rows = self.get_stats().get("by_agent")
+        if not isinstance(rows, list) or not rows:
+            return None
+        return {row.get("agent"): row.get("count", 0) for row in rows if isinstance(row, dict)}
+    
+    def _agents_to_query(self) -> tuple[str, ...]:
+        """KNOWN_AGENTS minus those `cass stats` reports as having no sessions."""
+        counts = self._stats_agent_counts()
+        if counts is None:
+            return self.KNOWN_AGENTS
+        return tuple(agent for agent in self.KNOWN_AGENTS if counts.get(agent, 0) > 0)
+    
+    def _crowded_out_agents(self, by_agent: dict[str, AgentSessions]) -> tuple[str, ...]:
+        """Agents with sessions that a truncated aggregate returned no hits for.
+        
+        Agents that did appear are kept as they are: stats counts conversations
+        while searches return message hits, so the two cannot be compared.
+        """
+        return tuple(agent for agent in self._agents_to_query() if agent not in by_agent)
+    
+    def _get_all_sessions_per_agent(self, agents: tuple[str, ...] | None = None) -> dict[str, AgentSessions]:
+        if agents is None:
+            agents = self._agents_to_query()
+        if not agents:
+            return {}
+        if sys.platform == "win32":
+            # selectors can only wait on sockets on Windows, not pipes
+            return self._get_all_sessions_threaded(agents)
+        return self._get_all_sessions_multiplexed(agents)
+    
+    def _get_all_sessions_multiplexed(self, agents: tuple[str, ...]) -> dict[str, AgentSessions]:
+        """Run one cass per agent at once, parsing every stream on this thread.
+        
+        Hits are decoded as their lines arrive, so parsing overlaps the other
+        processes' I/O and no full stdout is ever buffered. Agents whose cass
+        fails or outlives the CASS_TIMEOUT deadline come back empty.
+        """
+        by_agent = {agent: AgentSessions(agent=agent) for agent in agents}
+        seen: dict[str, set[str]] = {agent: set() for agent in agents}
+        procs: dict[int, tuple[str, subprocess.Popen]] = {}
+        pending: dict[int, bytes] = {}
+        append_hit = self._append_hit
+        
+        deadline = time.monotonic() + self.CASS_TIMEOUT
+        with selectors.DefaultSelector() as selector:
+            try:
+                for agent in agents:
+                    proc = subprocess.Popen(
+                        _jsonl_argv(self._agent_search_args(agent)),
+                        stdout=subprocess.PIPE,
+                        stderr=subprocess.DEVNULL,
+                        bufsize=0,
+                    )
+                    fd = proc.stdout.fileno()
+                    procs[fd] = (agent, proc)
+                    pending[fd] = b""
+                    selector.register(fd, selectors.EVENT_READ)
+                
+                while selector.get_map():
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    for key, _ in selector.select(remaining):
+                        fd = key.fd
+                        chunk = os.read(fd, 1 << 16)
+                        if chunk:
+                            *lines, pending[fd] = (pending[fd] + chunk).split(b"\n")
+                        else:
+                            selector.unregister(fd)
+                            lines = [pending.pop(fd)]
+                        
+                        agent = procs[fd][0]
+                        sessions, agent_seen = by_agent[agent], seen[agent]
+                        for line in lines:
+                            if (hit := _parse_hit_line(line)) is None:
+                                continue
+                            source_path = hit.get("source_path", "")
+                            if source_path in agent_seen:
+                                continue
+                            agent_seen.add(source_path)
+                            append_hit(sessions, hit)
+            except OSError:
+                # Includes cass not being installed
+                for agent in by_agent:
+                    by_agent[agent] = AgentSessions(agent=agent)
+            finally:
+                still_open = selector.get_map()
+                for fd, (agent, proc) in procs.items():
+                    proc.stdout.close()
+                    if fd not in still_open:
+                        # cass can close stdout and keep running; the
+                        # deadline still applies
+                        try:
+                            if proc.wait(timeout=max(deadline - time.monotonic(), 0)) == 0:
+                                continue
+                        except subprocess.TimeoutExpired:
+                            pass
+                    proc.kill()
+                    proc.wait()
+                    by_agent[agent] = AgentSessions(agent=agent)
+        
+        for sessions in by_agent.values():
+            sessions.sort_by_started()
+        return by_agent
+    
+    def _get_all_sessions_threaded(self, agents: tuple[str, ...]) -> dict[str, AgentSessions]:
+        by_agent: dict[str, AgentSessions] = {}
+        
+        # Each query is a separate cass process, so run them concurrently;
+        # wall time is bounded by the slowest agent rather than the sum.
+        with ThreadPoolExecutor(max_workers=len(agents)) as executor:
+            futures = {
+                executor.submit(self.get_sessions_for_agent, agent): agent
+                for agent in agents
+            }
+            for future in as_completed(futures):
+                by_agent[futures[future]] = future.result()
+        return by_agent
+    
+    def _cache_query(self) -> tuple[str, ...]:
+        if self.filter_by_workspace:
+            return ("workspace", str(self.workspace))
+        return ()
+    
+    def _load_disk_cache(
+        self,
+        st: os.stat_result,
+        wal: tuple[int, int] | None,
+        file_hash: Callable[[], int],
+    ) -> list[AgentSessions] | None:
+        if self.cache_path is None:
+            return None
+        try:
+            entry = pickle.loads(self.cache_path.read_bytes())
+            if not isinstance(entry, _CacheEntry):
+                return None
+            if entry.version != CACHE_VERSION or entry.query != self._cache_query():
+                return None
+            if entry.size != st.st_size or entry.wal != wal:
+                return None
+            if entry.mtime != st.st_mtime_ns:
+                # Touched but maybe not modified: fall back to the content hash
+                if file_hash() != entry.xxh3:
+                    return None
+                entry.mtime = st.st_mtime_ns
+                self._write_disk_cache(entry)
+            return pickle.loads(entry.payload)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, TypeError, ValueError, ImportError):
+            return None
+    
+    def _write_disk_cache(self, entry: _CacheEntry) -> None:
+        if self.cache_path is None:
+            return
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.cache_path.parent, prefix=".index-")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(pickle.dumps(entry))
+                os.replace(tmp, self.cache_path)
+            except BaseException:
+                os.unlink(tmp)
+                raise
+        except OSError:
+            pass
+    
+    def _resolve_db_path(self) -> Path | None:
+        if self._db_path is None:
+            if db_path := self.get_stats().get("db_path"):
+                self._db_path = Path(db_path)
+        return self._db_path
+    
     def get_all_agents_with_sessions(self) -> list[AgentSessions]:
-        result: list[AgentSessions] = []
+        db_path = self._resolve_db_path() if self.cache_path is not None else None
+        if db_path is None:
+            return self._query_all_agents_with_sessions()
+        try:
+            st = db_path.stat()
+        except OSError:
+            return self._query_all_agents_with_sessions()
+        wal = _wal_stat(db_path)
+        file_hash = cache(lambda: _hash_file(db_path))
+        
+        cached = self._load_disk_cache(st, wal, file_hash)
+        if cached is not None:
+            return cached
+        
+        result = self._query_all_agents_with_sessions()
+        # The entry is keyed on the pre-query stat. If cass wrote while the
+        # query ran, that key is already stale, so skip both the hash and the
+        # write; otherwise the content hashed now is the content queried
+        try:
+            after = db_path.stat()
+            if (after.st_mtime_ns, after.st_size) != (st.st_mtime_ns, st.st_size):
+                return result
+            if _wal_stat(db_path) != wal:
+                return result
+            xxh3 = file_hash()
+        except OSError:
+            return result
+        self._write_disk_cache(_CacheEntry(
+            mtime=st.st_mtime_ns,
+            size=st.st_size,
+            xxh3=xxh3,
+            payload=pickle.dumps(result),
+            query=self._cache_query(),
+            wal=wal,
+        ))
+        return result
+    
+    def _query_all_agents_with_sessions(self) -> list[AgentSessions]:
+        aggregated = self._get_all_sessions_aggregated()
+        if aggregated is None:
+            by_agent = self._get_all_sessions_per_agent()
+        else:
+            by_agent, hit_count = aggregated
+            # Hits are per message, so busy agents can use up the whole limit;
+            # query any agent the truncated aggregate left out on its own
+            if hit_count >= self.AGGREGATE_LIMIT:
+                if crowded := self._crowded_out_agents(by_agent):
+                    by_agent.update(self._get_all_sessions_per_agent(crowded))
         
-        for agent in self.KNOWN_AGENTS:
-            sessions = self.get_sessions_for_agent(agent)
-            if sessions:
-                result.append(AgentSessions(agent=agent, sessions=sessions))
+        # Rebuild in KNOWN_AGENTS order so ties in the count sort stay stable
+        result = [
+            by_agent[agent]
+            for agent in self.KNOWN_AGENTS
+            if agent in by_agent and by_agent[agent].count
+        ]
         
-        result.sort(key=lambda a: a.count, reverse=True)
+        result.sort(key=attrgetter("count"), reverse=True)
         return result
     
     def get_stats(self) -> dict:
@@ -130,4 +652,5 @@ class SessionIndex:
         return data if data else {}
     
     def refresh(self) -> None:
-        self._cache.clear()
+        with self._cache_lock:
+            self._cache.clear()
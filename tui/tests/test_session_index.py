@@ -0,0 +1,248 @@
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from cass_tui.services import session_index
+from cass_tui.services.session_index import SessionIndex
+
+
+STUB = """\
+#!{python}
+import json, os, sys, time
+
+args = sys.argv[1:]
+with open(os.environ["CASS_STUB_LOG"], "a") as log:
+    log.write(" ".join(args) + "\\n")
+with open(os.environ["CASS_STUB_SPEC"]) as f:
+    spec = json.load(f)
+
+if args[0] == "stats":
+    print(json.dumps(spec["stats"]))
+    sys.exit(0)
+
+agent = args[args.index("--agent") + 1] if "--agent" in args else None
+behaviour = spec["agents"].get(agent or "*", {{}})
+print(json.dumps({{"_meta": {{"count": len(behaviour.get("hits", []))}}}}))
+for hit in behaviour.get("hits", []):
+    print(json.dumps(hit), flush=True)
+if behaviour.get("write_db"):
+    with open(spec["stats"]["db_path"], "ab") as db:
+        db.write(b"new rows")
+if behaviour.get("linger"):
+    os.close(1)
+    time.sleep(behaviour["linger"])
+time.sleep(behaviour.get("sleep", 0))
+sys.exit(behaviour.get("exit", 0))
+"""
+
+
+class StubCass:
+    def __init__(self, tmp_path: Path) -> None:
+        self.dir = tmp_path / "bin"
+        self.dir.mkdir()
+        self.spec_path = tmp_path / "spec.json"
+        self.log_path = tmp_path / "calls.log"
+        self.db_path = tmp_path / "agent_search.db"
+        self.db_path.write_bytes(b"original")
+        self.log_path.write_text("")
+        self.configure(agents={})
+        script = self.dir / "cass"
+        script.write_text(STUB.format(python=sys.executable))
+        script.chmod(0o755)
+
+    def configure(self, agents: dict, by_agent: list | None = None) -> None:
+        stats = {"db_path": str(self.db_path), "by_agent": by_agent or []}
+        self.spec_path.write_text(json.dumps({"stats": stats, "agents": agents}))
+
+    def searches(self) -> list[str]:
+        calls = self.log_path.read_text().splitlines()
+        self.log_path.write_text("")
+        return [call for call in calls if call.startswith("search")]
+
+
+@pytest.fixture
+def cass(tmp_path, monkeypatch) -> StubCass:
+    stub = StubCass(tmp_path)
+    monkeypatch.setenv("PATH", f"{stub.dir}{os.pathsep}{os.environ['PATH']}")
+    monkeypatch.setenv("CASS_STUB_SPEC", str(stub.spec_path))
+    monkeypatch.setenv("CASS_STUB_LOG", str(stub.log_path))
+    return stub
+
+
+def hit(agent: str, path: str, created_at: int | None = None) -> dict:
+    return {"agent": agent, "source_path": path, "title": None, "created_at": created_at}
+
+
+def test_multiplexed_dedupes_and_sorts_newest_first(cass):
+    cass.configure(agents={"codex": {"hits": [
+        hit("codex", "/a", 1_000_000),
+        hit("codex", "/b", 3_000_000),
+        hit("codex", "/a", 9_000_000),
+        hit("codex", "/c"),
+        hit("codex", "/d", 2_000_000),
+    ]}})
+
+    by_agent = SessionIndex(cache_path=None)._get_all_sessions_multiplexed(("codex",))
+
+    assert by_agent["codex"].source_paths == ["/b", "/d", "/a", "/c"]
+    assert by_agent["codex"].started_ats == [3000.0, 2000.0, 1000.0, None]
+
+
+def test_multiplexed_nonzero_exit_returns_empty(cass):
+    cass.configure(agents={
+        "codex": {"hits": [hit("codex", "/a", 1)], "exit": 2},
+        "cursor": {"hits": [hit("cursor", "/b", 1)]},
+    })
+
+    by_agent = SessionIndex(cache_path=None)._get_all_sessions_multiplexed(("codex", "cursor"))
+
+    assert by_agent["codex"].count == 0
+    assert by_agent["cursor"].source_paths == ["/b"]
+
+
+def test_multiplexed_kills_agents_past_the_deadline(cass):
+    cass.configure(agents={
+        "codex": {"hits": [hit("codex", "/a", 1)], "sleep": 60},
+        "cursor": {"hits": [hit("cursor", "/b", 1)]},
+    })
+    index = SessionIndex(cache_path=None)
+    index.CASS_TIMEOUT = 1
+
+    started = time.monotonic()
+    by_agent = index._get_all_sessions_multiplexed(("codex", "cursor"))
+
+    assert time.monotonic() - started < 10
+    assert by_agent["codex"].count == 0
+    assert by_agent["cursor"].source_paths == ["/b"]
+
+
+def test_full_aggregate_requeries_only_missing_agents(cass):
+    busy = [hit("codex", f"/codex/{i % 20}", i) for i in range(SessionIndex.AGGREGATE_LIMIT)]
+    cass.configure(
+        agents={"*": {"hits": busy}, "cursor": {"hits": [hit("cursor", "/cursor/0", 1)]}},
+        by_agent=[
+            {"agent": "codex", "count": 300},
+            {"agent": "cursor", "count": 5},
+            {"agent": "gemini", "count": 0},
+        ],
+    )
+
+    agents = SessionIndex(cache_path=None).get_all_agents_with_sessions()
+
+    assert [(a.agent, a.count) for a in agents] == [("codex", 20), ("cursor", 1)]
+    assert [call.split(" --fields")[0] for call in cass.searches()] == [
+        "search  --limit 1000",
+        "search  --agent cursor --limit 100",
+    ]
+
+
+def test_partial_aggregate_is_not_requeried(cass):
+    cass.configure(
+        agents={"*": {"hits": [hit("codex", "/a", 1)]}},
+        by_agent=[{"agent": "codex", "count": 1}, {"agent": "cursor", "count": 5}],
+    )
+
+    agents = SessionIndex(cache_path=None).get_all_agents_with_sessions()
+
+    assert [a.agent for a in agents] == ["codex"]
+    assert len(cass.searches()) == 1
+
+
+def test_multiplexed_kills_agents_lingering_after_stdout_closes(cass):
+    cass.configure(agents={
+        "codex": {"hits": [hit("codex", "/a", 1)], "linger": 60},
+        "cursor": {"hits": [hit("cursor", "/b", 1)]},
+    })
+    index = SessionIndex(cache_path=None)
+    index.CASS_TIMEOUT = 1
+
+    started = time.monotonic()
+    by_agent = index._get_all_sessions_multiplexed(("codex", "cursor"))
+
+    assert time.monotonic() - started < 10
+    assert by_agent["codex"].count == 0
+    assert by_agent["cursor"].source_paths == ["/b"]
+
+
+def test_stream_kills_agents_lingering_after_stdout_closes(cass):
+    cass.configure(agents={"codex": {"hits": [hit("codex", "/a", 1)], "linger": 60}})
+    index = SessionIndex(cache_path=None)
+    index.CASS_TIMEOUT = 1
+
+    started = time.monotonic()
+    sessions = index.get_sessions_for_agent("codex")
+
+    assert time.monotonic() - started < 10
+    assert sessions.count == 0
+
+
+@pytest.fixture
+def cached(cass, tmp_path):
+    cass.configure(agents={"*": {"hits": [hit("codex", "/a", 1)]}})
+    cache_path = tmp_path / "cache" / "index.bin"
+
+    def load(**kwargs) -> list:
+        return SessionIndex(cache_path=cache_path, **kwargs).get_all_agents_with_sessions()
+
+    assert [a.agent for a in load()] == ["codex"]
+    assert len(cass.searches()) == 1
+    return load
+
+
+def test_cache_hit_skips_the_search(cass, cached):
+    assert [a.source_paths for a in cached()] == [["/a"]]
+    assert cass.searches() == []
+
+
+def test_cache_accepts_mtime_only_touch(cass, cached):
+    st = cass.db_path.stat()
+    os.utime(cass.db_path, ns=(st.st_atime_ns, st.st_mtime_ns + 5_000_000_000))
+
+    cached()
+    assert cass.searches() == []
+    cached()
+    assert cass.searches() == []
+
+
+def test_cache_rejects_same_size_content_change(cass, cached):
+    st = cass.db_path.stat()
+    cass.db_path.write_bytes(b"modified")
+    os.utime(cass.db_path, ns=(st.st_atime_ns, st.st_mtime_ns + 5_000_000_000))
+
+    cached()
+    assert len(cass.searches()) == 1
+
+
+def test_cache_rejects_new_wal_sidecar(cass, cached):
+    Path(f"{cass.db_path}-wal").write_bytes(b"committed frames")
+
+    cached()
+    assert len(cass.searches()) == 1
+
+
+def test_cache_rejects_version_mismatch(cass, cached, monkeypatch):
+    monkeypatch.setattr(session_index, "CACHE_VERSION", session_index.CACHE_VERSION + 1)
+
+    cached()
+    assert len(cass.searches()) == 1
+
+
+def test_cache_rejects_query_mismatch(cass, cached):
+    cached(filter_by_workspace=True)
+    assert len(cass.searches()) == 1
+
+
+def test_cache_skips_entry_when_database_changes_mid_query(cass, tmp_path, monkeypatch):
+    cass.configure(agents={"*": {"hits": [hit("codex", "/a", 1)], "write_db": True}})
+    cache_path = tmp_path / "cache" / "index.bin"
+    hashed = []
+    monkeypatch.setattr(session_index, "_hash_file", hashed.append)
+
+    SessionIndex(cache_path=cache_path).get_all_agents_with_sessions()
+
+    assert hashed == []
+    assert not cache_path.exists()